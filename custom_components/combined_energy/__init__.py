@@ -15,9 +15,13 @@ from .const import (
     DATA_API_CLIENT,
     DATA_INSTALLATION,
     DATA_LOG_SESSION,
+    DATA_READINGS,
     DOMAIN,
 )
-from .coordinator import CombinedEnergyLogSessionCoordinator
+from .coordinator import (
+    CombinedEnergyLogSessionCoordinator,
+    CombinedEnergyReadingsCoordinator,
+)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
@@ -39,14 +43,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except CombinedEnergyError as ex:
         raise ConfigEntryNotReady from ex
 
-    # Initialise the "log session refresh" coordinator
+    # The log session must be started before readings are requested,
+    # otherwise the first readings may come back empty.
     log_session = CombinedEnergyLogSessionCoordinator(hass, api)
     await log_session.async_config_entry_first_refresh()
+    readings = CombinedEnergyReadingsCoordinator(hass, api)
+    await readings.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         DATA_API_CLIENT: api,
         DATA_INSTALLATION: installation,
         DATA_LOG_SESSION: log_session,
+        DATA_READINGS: readings,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
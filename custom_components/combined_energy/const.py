@@ -11,6 +11,7 @@ LOGGER = logging.getLogger(__package__)
 DATA_API_CLIENT: Final[str] = "api_client"
 DATA_LOG_SESSION: Final[str] = "log_session"
 DATA_INSTALLATION: Final[str] = "installation"
+DATA_READINGS: Final[str] = "readings"
 
 # Config for combined energy requests.
 CONF_INSTALLATION_ID: Final[str] = "installation_id"
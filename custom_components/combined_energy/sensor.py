@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from abc import abstractmethod
-from collections.abc import Generator, Sequence
-from datetime import datetime
-from typing import Any, cast
+from collections.abc import Callable, Collection
+from math import fsum
+from operator import attrgetter
+import sys
+from typing import Any
 
-from combined_energy import CombinedEnergy
 from combined_energy.models import Device, DeviceReadings, Installation
 
 from homeassistant.components.sensor import (
@@ -23,16 +23,17 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DATA_API_CLIENT, DATA_INSTALLATION, DOMAIN
+from .const import DATA_INSTALLATION, DATA_READINGS, DOMAIN, LOGGER
 from .coordinator import CombinedEnergyReadingsCoordinator
 
 # Common sensors for all consumer devices
-SENSOR_DESCRIPTIONS_GENERIC_CONSUMER = [
+SENSOR_DESCRIPTIONS_GENERIC_CONSUMER = (
     SensorEntityDescription(
         key="energy_consumed",
         translation_key="energy_consumed",
@@ -101,9 +102,9 @@ SENSOR_DESCRIPTIONS_GENERIC_CONSUMER = [
         device_class=SensorDeviceClass.POWER,
         entity_registry_enabled_default=False,
     ),
-]
-SENSOR_DESCRIPTIONS = {
-    "SOLAR_PV": [
+)
+SENSOR_DESCRIPTIONS: dict[str, tuple[SensorEntityDescription, ...]] = {
+    "SOLAR_PV": (
         SensorEntityDescription(
             key="energy_supplied",
             translation_key="solar_pv_energy_supplied",
@@ -120,10 +121,10 @@ SENSOR_DESCRIPTIONS = {
             native_unit_of_measurement=UnitOfPower.KILO_WATT,
             device_class=SensorDeviceClass.POWER,
         ),
-    ],
+    ),
     "WATER_HEATER": (
         SENSOR_DESCRIPTIONS_GENERIC_CONSUMER
-        + [
+        + (
             SensorEntityDescription(
                 key="available_energy",
                 translation_key="water_heater_available_energy",
@@ -199,9 +200,9 @@ SENSOR_DESCRIPTIONS = {
                 device_class=SensorDeviceClass.TEMPERATURE,
                 entity_registry_enabled_default=False,
             ),
-        ]
+        )
     ),
-    "GRID_METER": [
+    "GRID_METER": (
         SensorEntityDescription(
             key="energy_supplied",
             translation_key="grid_meter_energy_supplied",
@@ -315,7 +316,7 @@ SENSOR_DESCRIPTIONS = {
             device_class=SensorDeviceClass.VOLTAGE,
             entity_registry_enabled_default=False,
         ),
-    ],
+    ),
     "GENERIC_CONSUMER": SENSOR_DESCRIPTIONS_GENERIC_CONSUMER,
     "ENERGY_BALANCE": SENSOR_DESCRIPTIONS_GENERIC_CONSUMER,
 }
@@ -328,34 +329,75 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensors."""
 
-    api: CombinedEnergy = hass.data[DOMAIN][entry.entry_id][DATA_API_CLIENT]
-    installation: Installation = hass.data[DOMAIN][entry.entry_id][DATA_INSTALLATION]
-
-    # Initialise readings coordinator
-    readings = CombinedEnergyReadingsCoordinator(hass, api)
-    await readings.async_config_entry_first_refresh()
+    data = hass.data[DOMAIN][entry.entry_id]
+    installation: Installation = data[DATA_INSTALLATION]
+    readings: CombinedEnergyReadingsCoordinator = data[DATA_READINGS]
+
+    # Sensors disabled in the entity registry are never added to Home Assistant
+    # so don't create them; enabling one reloads the config entry.
+    entity_registry = er.async_get(hass)
+    disabled_unique_ids = {
+        entity.unique_id
+        for entity in er.async_entries_for_config_entry(
+            entity_registry, entry.entry_id
+        )
+        if entity.disabled
+    }
 
-    async_add_entities(_generate_sensors(installation, readings))
+    async_add_entities(
+        _generate_sensors(installation, readings, skip_unique_ids=disabled_unique_ids)
+    )
 
 
 def _generate_sensors(
     installation: Installation,
     readings: CombinedEnergyReadingsCoordinator,
-) -> Generator[CombinedEnergyReadingsSensor, None, None]:
+    *,
+    skip_unique_ids: Collection[str] = (),
+) -> list[CombinedEnergyReadingsSensor]:
     """Generate sensor entities from installed devices."""
 
+    sensors: list[CombinedEnergyReadingsSensor] = []
+    installation_id = readings.api.installation_id
     for device in installation.devices:
         if descriptions := SENSOR_DESCRIPTIONS.get(device.device_type):
+            # Device details are shared by all sensors of the device
+            identifier = f"install_{installation_id}-device_{device.device_id}"
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, identifier)},
+                manufacturer=_intern(device.device_manufacturer),
+                model=_intern(device.device_model_name),
+                name=device.display_name,
+            )
+
             # Generate sensors from descriptions for the current device type
             for description in descriptions:
-                if sensor_type := SENSOR_TYPE_MAP.get(
-                    description.device_class, GenericSensor
-                ):
-                    yield sensor_type(device, description, readings)
+                unique_id = f"{identifier}-{description.key}"
+                if unique_id in skip_unique_ids:
+                    continue
+                sensors.append(
+                    CombinedEnergyReadingsSensor(
+                        device,
+                        description,
+                        readings,
+                        unique_id=unique_id,
+                        device_info=device_info,
+                    )
+                )
+    return sensors
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern strings repeated across devices, such as manufacturer and model."""
+    return sys.intern(value) if value is not None else None
 
 
 class CombinedEnergyReadingsSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a Combined Energy API reading energy sensor."""
+    """Representation of a Combined Energy API reading sensor.
+
+    How a raw reading is converted into the sensor value is determined by the
+    device class of the description, see VALUE_CONVERTERS.
+    """
 
     entity_description: SensorEntityDescription
     _attr_has_entity_name = True
@@ -365,131 +407,137 @@ class CombinedEnergyReadingsSensor(CoordinatorEntity, SensorEntity):
         device: Device,
         description: SensorEntityDescription,
         coordinator: CombinedEnergyReadingsCoordinator,
+        *,
+        unique_id: str,
+        device_info: DeviceInfo,
     ) -> None:
-        """Initialise Readings Sensor."""
+        """Initialise Readings Sensor.
+
+        The unique id is built by _generate_sensors, which also uses it to
+        skip disabled entities. The device info is shared between the sensors
+        of a device.
+        """
         super().__init__(coordinator)
 
         self.device_id = device.device_id
         self.entity_description = description
-
-        identifier = (
-            f"install_{self.coordinator.api.installation_id}-device_{device.device_id}"
+        self._reading_getter = attrgetter(description.key)
+        self._convert, self._precision = VALUE_CONVERTERS.get(
+            description.device_class, VALUE_CONVERTERS[None]
         )
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, identifier)},
-            manufacturer=device.device_manufacturer,
-            model=device.device_model_name,
-            name=device.display_name,
+        self._attr_suggested_display_precision = self._precision
+        # Energy is totalled over the readings range
+        self._last_reset_getter = (
+            attrgetter("range_start")
+            if description.device_class == SensorDeviceClass.ENERGY
+            else None
         )
-        self._attr_unique_id = f"{identifier}-{description.key}"
 
-    @property
-    def device_readings(self) -> DeviceReadings | None:
-        """Get readings for specific device."""
+        self._attr_device_info = device_info
+        self._attr_unique_id = unique_id
+
+        self._update_from_readings()
+
+    def _update_from_readings(self) -> None:
+        """Update the sensor state from the latest device readings."""
+        device_readings: DeviceReadings | None = None
+        raw_value: Any = None
+        value: int | float | None = None
         if data := self.coordinator.data:
-            return data.get(self.device_id, None)
-        return None
+            if device_readings := data.get(self.device_id):
+                try:
+                    raw_value = self._reading_getter(device_readings)
+                    if raw_value is not None:
+                        value = self._convert(raw_value, self._precision)
+                except (TypeError, ValueError, IndexError) as ex:
+                    # A malformed reading only makes this sensor unavailable
+                    LOGGER.debug("Invalid reading for %s: %s", self.unique_id, ex)
+                    raw_value = None
+
+        self._attr_available = raw_value is not None
+        self._attr_native_value = value
+        self._attr_last_reset = (
+            self._last_reset_getter(device_readings)
+            if self._last_reset_getter and device_readings
+            else None
+        )
 
-    @property
-    def _raw_value(self) -> Any:
-        """Get raw reading value from device readings."""
-        if device_readings := self.device_readings:
-            return getattr(device_readings, self.entity_description.key)
-        return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        The state is only written if it differs from the current state.
+        """
+        previous = (
+            self._attr_available,
+            self._attr_native_value,
+            self._attr_last_reset,
+        )
+        self._update_from_readings()
+        if previous == (
+            self._attr_available,
+            self._attr_native_value,
+            self._attr_last_reset,
+        ):
+            return
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Indicate if the entity is available."""
-        return self._raw_value is not None
-
-    @abstractmethod
-    def _to_native_value(self, raw_value: Any) -> int | float | None:
-        """Convert non-none raw value into usable sensor value."""
-
-    @property
-    def native_value(self) -> int | float | None:
-        """Return the state of the sensor."""
-        if (raw_value := self._raw_value) is not None:
-            return self._to_native_value(raw_value)
-        return None
-
-
-class GenericSensor(CombinedEnergyReadingsSensor):
-    """Sensor that returns the last value of a sequence of readings."""
-
-    _attr_suggested_display_precision = 2
-
-    def _to_native_value(self, raw_value: Any) -> float:
-        """Convert non-none raw value into usable sensor value."""
-        if isinstance(raw_value, Sequence):
-            raw_value = raw_value[-1]
-        return float(round(raw_value, self.suggested_display_precision))
+        return self._attr_available
 
 
-class EnergySensor(CombinedEnergyReadingsSensor):
-    """Sensor for energy readings."""
+def _last_sample(raw_value: Any) -> Any:
+    """Last value of a sequence of readings, or the reading itself."""
+    if isinstance(raw_value, (list, tuple)):
+        return raw_value[-1] if raw_value else None
+    return raw_value
 
-    _attr_suggested_display_precision = 2
 
-    @property
-    def last_reset(self) -> datetime | None:
-        """Last time the data was reset."""
-        if device_readings := self.device_readings:
-            # mypy is struggling with a Pydantic model here, the cast isn't technically required
-            return cast(datetime | None, device_readings.range_start)
+def _latest(raw_value: Any, precision: int | None) -> int | float | None:
+    """Last value of a sequence of readings."""
+    if (value := _last_sample(raw_value)) is None:
         return None
+    return round(value, precision)
 
-    def _to_native_value(self, raw_value: Any) -> float:
-        """Convert non-none raw value into usable sensor value."""
-        value = sum(raw_value)
-        return float(round(value, self.suggested_display_precision))
-
-
-class PowerSensor(CombinedEnergyReadingsSensor):
-    """Sensor for power readings."""
-
-    _attr_suggested_display_precision = 2
-
-    def _to_native_value(self, raw_value: Any) -> float:
-        """Convert non-none raw value into usable sensor value."""
-        return float(round(raw_value, self.suggested_display_precision))
 
+def _total(raw_value: Any, precision: int | None) -> float | None:
+    """Total of a sequence of energy readings, ignoring missing samples."""
+    values = [value for value in raw_value if value is not None]
+    if not values:
+        return None
+    return round(fsum(values), precision)
 
-class PowerFactorSensor(CombinedEnergyReadingsSensor):
-    """Sensor for power factor readings."""
 
-    _attr_suggested_display_precision = 1
+def _scalar(raw_value: Any, precision: int | None) -> int | float:
+    """Single reading value."""
+    return round(raw_value, precision)
 
-    def _to_native_value(self, raw_value: Any) -> float:
-        """Convert non-none raw value into usable sensor value."""
-        # The API expresses the power factor as a fraction convert to %
-        if isinstance(raw_value, Sequence):
-            raw_value = raw_value[-1]
-        if raw_value is not None:
-            return float(round(raw_value * 100, self.suggested_display_precision))
-        else:
-            return None
 
+def _percentage(raw_value: Any, precision: int | None) -> float | None:
+    """Last value of a sequence of fractions, expressed as a %."""
+    if (value := _last_sample(raw_value)) is None:
+        return None
+    return round(value * 100.0, precision)
 
-class WaterVolumeSensor(CombinedEnergyReadingsSensor):
-    """Sensor for water volume readings."""
 
-    def _to_native_value(self, raw_value: Any) -> int:
-        """Convert non-none raw value into usable sensor value."""
-        if isinstance(raw_value, Sequence):
-            raw_value = raw_value[-1]
-        if raw_value is not None:
-            return int(round(raw_value, 0))
-        else:
-            return None
+def _latest_int(raw_value: Any, precision: int | None) -> int | None:
+    """Last value of a sequence of readings as a whole number."""
+    if (value := _last_sample(raw_value)) is None:
+        return None
+    return int(round(value, 0))
 
 
-# Map of common device classes to specific sensor types
-SENSOR_TYPE_MAP: dict[
-    SensorDeviceClass | str | None, type[CombinedEnergyReadingsSensor]
+# Map of device classes to the value converter and display precision, the
+# None entry is used for any other device class
+VALUE_CONVERTERS: dict[
+    SensorDeviceClass | str | None,
+    tuple[Callable[[Any, int | None], int | float | None], int | None],
 ] = {
-    SensorDeviceClass.ENERGY: EnergySensor,
-    SensorDeviceClass.POWER: PowerSensor,
-    SensorDeviceClass.WATER: WaterVolumeSensor,
-    SensorDeviceClass.POWER_FACTOR: PowerFactorSensor,
+    SensorDeviceClass.ENERGY: (_total, 2),
+    SensorDeviceClass.POWER: (_scalar, 2),
+    SensorDeviceClass.WATER: (_latest_int, None),
+    SensorDeviceClass.POWER_FACTOR: (_percentage, 1),
+    None: (_latest, 2),
 }